@@ -4,8 +4,11 @@
 
 import { NextResponse } from "next/server";
 
+// 模块加载时解析一次，避免每次请求重复解析环境变量
+const RATE_LIMIT = parseInt(process.env.RATE_LIMIT_PER_DAY || "3", 10);
+
 export async function GET() {
     return NextResponse.json({
-        rateLimit: parseInt(process.env.RATE_LIMIT_PER_DAY || "3", 10),
+        rateLimit: RATE_LIMIT,
     });
 }
@@ -55,6 +55,21 @@ interface ChatPanelProps {
     onSendMessage?: (message: string) => void;
 }
 
+// 编辑意图关键词（预编译为单个正则，一次扫描完成匹配）
+const EDIT_INTENT_PATTERN = new RegExp([
+    "修改", "改为", "改成", "更改", "替换",
+    "删除", "移除", "去掉",
+    "添加", "新增", "增加", "插入",
+    "连接", "连线", "指向",
+    "重命名", "改名",
+].join("|"));
+
+// 全局编辑意图关键词
+const GLOBAL_EDIT_PATTERN = new RegExp([
+    "全部", "全流程", "整个", "所有", "全改", "都改",
+    "翻译", "转换", "中文", "英文", "改为中文", "改为英文",
+].join("|"));
+
 export function ChatPanel({ onSendMessage }: ChatPanelProps) {
     const [input, setInput] = useState("");
     const [messages, setMessages] = useState<Message[]>([]);
@@ -297,23 +312,12 @@ export function ChatPanel({ onSendMessage }: ChatPanelProps) {
 
     // 检测编辑意图
     const detectEditIntent = (message: string): boolean => {
-        const editKeywords = [
-            "修改", "改为", "改成", "更改", "替换",
-            "删除", "移除", "去掉",
-            "添加", "新增", "增加", "插入",
-            "连接", "连线", "指向",
-            "重命名", "改名",
-        ];
-        return editKeywords.some((kw) => message.includes(kw));
+        return EDIT_INTENT_PATTERN.test(message);
     };
 
     // 检测全局编辑意图（修改整个流程图）
     const detectGlobalEditIntent = (message: string): boolean => {
-        const globalKeywords = [
-            "全部", "全流程", "整个", "所有", "全改", "都改",
-            "翻译", "转换", "中文", "英文", "改为中文", "改为英文",
-        ];
-        return globalKeywords.some((kw) => message.includes(kw)) && detectEditIntent(message);
+        return GLOBAL_EDIT_PATTERN.test(message) && detectEditIntent(message);
     };
 
     const scrollToBottom = useCallback(() => {
@@ -117,9 +117,20 @@ export function FileProvider({ children }: { children: ReactNode }) {
     useEffect(() => {
         async function init() {
             try {
-                const files = await listFiles();
                 const recentFileIds = getRecentFileIds();
 
+                // 文件列表和最近打开的文件互不依赖，并发加载
+                const [files, recentFile] = await Promise.all([
+                    listFiles(),
+                    // 最近文件加载失败不影响文件列表
+                    recentFileIds.length > 0
+                        ? getFile(recentFileIds[0]).catch((error) => {
+                            console.error("Failed to open recent file:", error);
+                            return undefined;
+                        })
+                        : undefined,
+                ]);
+
                 setState(prev => ({
                     ...prev,
                     files,
@@ -128,15 +139,12 @@ export function FileProvider({ children }: { children: ReactNode }) {
                 }));
 
                 // 如果有最近打开的文件，自动打开
-                if (recentFileIds.length > 0) {
-                    const recentFile = await getFile(recentFileIds[0]);
-                    if (recentFile) {
-                        setCurrentFile(recentFile);
-                        setState(prev => ({
-                            ...prev,
-                            currentFileId: recentFile.id,
-                        }));
-                    }
+                if (recentFile) {
+                    setCurrentFile(recentFile);
+                    setState(prev => ({
+                        ...prev,
+                        currentFileId: recentFile.id,
+                    }));
                 }
             } catch (error) {
                 console.error("Failed to initialize file manager:", error);
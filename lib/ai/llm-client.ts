@@ -39,6 +39,39 @@ const DEFAULT_MODELS: Record<LLMProvider, string> = {
     gemini: "gemini-1.5-pro",
 };
 
+/**
+ * 逐行读取 SSE 流并回调每条 data 字段
+ * 网络分块可能在行中间截断，未结束的行会缓存到下一块再处理
+ */
+async function readSSEData(
+    reader: ReadableStreamDefaultReader<Uint8Array>,
+    onData: (data: string) => void
+): Promise<void> {
+    const decoder = new TextDecoder();
+    let buffer = "";
+
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split("\n");
+        // 最后一段可能是不完整的行
+        buffer = lines.pop() ?? "";
+
+        for (const line of lines) {
+            if (line.startsWith("data: ")) {
+                onData(line.slice(6));
+            }
+        }
+    }
+
+    buffer += decoder.decode();
+    if (buffer.startsWith("data: ")) {
+        onData(buffer.slice(6));
+    }
+}
+
 /**
  * 流式调用 OpenAI 兼容 API
  */
@@ -77,35 +110,23 @@ async function streamOpenAI(
         throw new Error("No response body");
     }
 
-    const decoder = new TextDecoder();
     let accumulated = "";
 
     try {
-        while (true) {
-            const { done, value } = await reader.read();
-            if (done) break;
-
-            const chunk = decoder.decode(value);
-            const lines = chunk.split("\n").filter((line) => line.trim() !== "");
-
-            for (const line of lines) {
-                if (line.startsWith("data: ")) {
-                    const data = line.slice(6);
-                    if (data === "[DONE]") continue;
-
-                    try {
-                        const parsed = JSON.parse(data);
-                        const content = parsed.choices?.[0]?.delta?.content || "";
-                        if (content) {
-                            accumulated += content;
-                            callbacks.onToken(content, accumulated);
-                        }
-                    } catch {
-                        // 忽略解析错误
-                    }
+        await readSSEData(reader, (data) => {
+            if (data === "[DONE]") return;
+
+            try {
+                const parsed = JSON.parse(data);
+                const content = parsed.choices?.[0]?.delta?.content || "";
+                if (content) {
+                    accumulated += content;
+                    callbacks.onToken(content, accumulated);
                 }
+            } catch {
+                // 忽略解析错误
             }
-        }
+        });
         callbacks.onComplete(accumulated);
     } catch (error) {
         callbacks.onError(error instanceof Error ? error : new Error(String(error)));
@@ -154,35 +175,23 @@ async function streamAnthropic(
         throw new Error("No response body");
     }
 
-    const decoder = new TextDecoder();
     let accumulated = "";
 
     try {
-        while (true) {
-            const { done, value } = await reader.read();
-            if (done) break;
-
-            const chunk = decoder.decode(value);
-            const lines = chunk.split("\n").filter((line) => line.trim() !== "");
-
-            for (const line of lines) {
-                if (line.startsWith("data: ")) {
-                    const data = line.slice(6);
-                    try {
-                        const parsed = JSON.parse(data);
-                        if (parsed.type === "content_block_delta") {
-                            const content = parsed.delta?.text || "";
-                            if (content) {
-                                accumulated += content;
-                                callbacks.onToken(content, accumulated);
-                            }
-                        }
-                    } catch {
-                        // 忽略解析错误
+        await readSSEData(reader, (data) => {
+            try {
+                const parsed = JSON.parse(data);
+                if (parsed.type === "content_block_delta") {
+                    const content = parsed.delta?.text || "";
+                    if (content) {
+                        accumulated += content;
+                        callbacks.onToken(content, accumulated);
                     }
                 }
+            } catch {
+                // 忽略解析错误
             }
-        }
+        });
         callbacks.onComplete(accumulated);
     } catch (error) {
         callbacks.onError(error instanceof Error ? error : new Error(String(error)));
@@ -240,33 +249,21 @@ async function streamGemini(
         throw new Error("No response body");
     }
 
-    const decoder = new TextDecoder();
     let accumulated = "";
 
     try {
-        while (true) {
-            const { done, value } = await reader.read();
-            if (done) break;
-
-            const chunk = decoder.decode(value);
-            const lines = chunk.split("\n").filter((line) => line.trim() !== "");
-
-            for (const line of lines) {
-                if (line.startsWith("data: ")) {
-                    const data = line.slice(6);
-                    try {
-                        const parsed = JSON.parse(data);
-                        const content = parsed.candidates?.[0]?.content?.parts?.[0]?.text || "";
-                        if (content) {
-                            accumulated += content;
-                            callbacks.onToken(content, accumulated);
-                        }
-                    } catch {
-                        // 忽略解析错误
-                    }
+        await readSSEData(reader, (data) => {
+            try {
+                const parsed = JSON.parse(data);
+                const content = parsed.candidates?.[0]?.content?.parts?.[0]?.text || "";
+                if (content) {
+                    accumulated += content;
+                    callbacks.onToken(content, accumulated);
                 }
+            } catch {
+                // 忽略解析错误
             }
-        }
+        });
         callbacks.onComplete(accumulated);
     } catch (error) {
         callbacks.onError(error instanceof Error ? error : new Error(String(error)));
@@ -459,35 +456,23 @@ async function streamSystemApi(
         throw new Error("No response body");
     }
 
-    const decoder = new TextDecoder();
     let accumulated = "";
 
     try {
-        while (true) {
-            const { done, value } = await reader.read();
-            if (done) break;
-
-            const chunk = decoder.decode(value);
-            const lines = chunk.split("\n").filter((line) => line.trim() !== "");
-
-            for (const line of lines) {
-                if (line.startsWith("data: ")) {
-                    const data = line.slice(6);
-                    try {
-                        const parsed = JSON.parse(data);
-                        if (parsed.type === "content_block_delta") {
-                            const content = parsed.delta?.text || "";
-                            if (content) {
-                                accumulated += content;
-                                callbacks.onToken(content, accumulated);
-                            }
-                        }
-                    } catch {
-                        // 忽略解析错误
+        await readSSEData(reader, (data) => {
+            try {
+                const parsed = JSON.parse(data);
+                if (parsed.type === "content_block_delta") {
+                    const content = parsed.delta?.text || "";
+                    if (content) {
+                        accumulated += content;
+                        callbacks.onToken(content, accumulated);
                     }
                 }
+            } catch {
+                // 忽略解析错误
             }
-        }
+        });
         callbacks.onComplete(accumulated);
     } catch (error) {
         callbacks.onError(error instanceof Error ? error : new Error(String(error)));
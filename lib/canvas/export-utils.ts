@@ -11,6 +11,9 @@ interface ExportData {
     appState?: Record<string, unknown>;
 }
 
+// 导入文件大小上限，超过则不读取和解析
+const MAX_IMPORT_FILE_SIZE = 20 * 1024 * 1024;
+
 /**
  * 导出为 JSON 文件
  */
@@ -38,6 +41,11 @@ export function exportToJSON(elements: readonly ExcalidrawElement[], filename?:
  * 从 JSON 文件导入
  */
 export async function importFromJSON(file: File): Promise<ExcalidrawElement[]> {
+    // 先检查大小，避免把超大文件整体读入内存再解析
+    if (file.size > MAX_IMPORT_FILE_SIZE) {
+        throw new Error("File is too large to import");
+    }
+
     return new Promise((resolve, reject) => {
         const reader = new FileReader();
 
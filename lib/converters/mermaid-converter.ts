@@ -4,7 +4,6 @@
  * 支持降级显示不完全支持的图表类型
  */
 
-import { parseMermaidToExcalidraw } from "@excalidraw/mermaid-to-excalidraw";
 import { ExcalidrawElement } from "@/components/canvas/ExcalidrawWrapper";
 import { autoFallback, generateFlowchartFromJSON, type FallbackResult } from "./mermaid-fallback";
 
@@ -73,6 +72,9 @@ export async function convertMermaidToElements(
             }
         }
 
+        // 按需加载 Mermaid 解析器（依赖整个 mermaid 库），不计入首屏包体积
+        const { parseMermaidToExcalidraw } = await import("@excalidraw/mermaid-to-excalidraw");
+
         // 使用官方配置解析 Mermaid 代码
         const result = await parseMermaidToExcalidraw(codeToConvert, {
             themeVariables: {
@@ -14,10 +14,12 @@ export {
     getNode,
     getNodesByModule,
     deleteNode,
+    deleteNodes,
     saveEdge,
     getEdge,
     getEdgesByModule,
     deleteEdge,
+    deleteEdges,
     saveSnapshot,
     getSnapshot,
     getSnapshotsByProject,
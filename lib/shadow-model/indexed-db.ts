@@ -64,6 +64,8 @@ interface SmartCanvasDB extends DBSchema {
 }
 
 let dbInstance: IDBPDatabase<SmartCanvasDB> | null = null;
+// 正在打开中的连接，避免并发调用重复 openDB
+let dbOpening: Promise<IDBPDatabase<SmartCanvasDB>> | null = null;
 
 /**
  * 获取数据库实例
@@ -73,47 +75,60 @@ export async function getDB(): Promise<IDBPDatabase<SmartCanvasDB>> {
         return dbInstance;
     }
 
-    dbInstance = await openDB<SmartCanvasDB>(DB_NAME, DB_VERSION, {
-        upgrade(db) {
-            // 项目表
-            if (!db.objectStoreNames.contains("projects")) {
-                const projectStore = db.createObjectStore("projects", { keyPath: "id" });
-                projectStore.createIndex("by-updated", "updatedAt");
-            }
-
-            // 模块表
-            if (!db.objectStoreNames.contains("modules")) {
-                const moduleStore = db.createObjectStore("modules", { keyPath: "id" });
-                moduleStore.createIndex("by-project", "projectId");
-            }
-
-            // 节点表
-            if (!db.objectStoreNames.contains("nodes")) {
-                const nodeStore = db.createObjectStore("nodes", { keyPath: "id" });
-                nodeStore.createIndex("by-module", "moduleId");
-            }
-
-            // 连线表
-            if (!db.objectStoreNames.contains("edges")) {
-                const edgeStore = db.createObjectStore("edges", { keyPath: "id" });
-                edgeStore.createIndex("by-module", "moduleId");
-            }
-
-            // 快照表
-            if (!db.objectStoreNames.contains("snapshots")) {
-                const snapshotStore = db.createObjectStore("snapshots", { keyPath: "id" });
-                snapshotStore.createIndex("by-project", "projectId");
-                snapshotStore.createIndex("by-created", "createdAt");
-            }
-
-            // 画布元素表
-            if (!db.objectStoreNames.contains("elements")) {
-                const elementStore = db.createObjectStore("elements", { keyPath: "id" });
-                elementStore.createIndex("by-project", "projectId");
-            }
-        },
-    });
+    if (dbOpening === null) {
+        dbOpening = openDB<SmartCanvasDB>(DB_NAME, DB_VERSION, {
+            upgrade(db) {
+                // 项目表
+                if (!db.objectStoreNames.contains("projects")) {
+                    const projectStore = db.createObjectStore("projects", { keyPath: "id" });
+                    projectStore.createIndex("by-updated", "updatedAt");
+                }
+
+                // 模块表
+                if (!db.objectStoreNames.contains("modules")) {
+                    const moduleStore = db.createObjectStore("modules", { keyPath: "id" });
+                    moduleStore.createIndex("by-project", "projectId");
+                }
+
+                // 节点表
+                if (!db.objectStoreNames.contains("nodes")) {
+                    const nodeStore = db.createObjectStore("nodes", { keyPath: "id" });
+                    nodeStore.createIndex("by-module", "moduleId");
+                }
+
+                // 连线表
+                if (!db.objectStoreNames.contains("edges")) {
+                    const edgeStore = db.createObjectStore("edges", { keyPath: "id" });
+                    edgeStore.createIndex("by-module", "moduleId");
+                }
+
+                // 快照表
+                if (!db.objectStoreNames.contains("snapshots")) {
+                    const snapshotStore = db.createObjectStore("snapshots", { keyPath: "id" });
+                    snapshotStore.createIndex("by-project", "projectId");
+                    snapshotStore.createIndex("by-created", "createdAt");
+                }
+
+                // 画布元素表
+                if (!db.objectStoreNames.contains("elements")) {
+                    const elementStore = db.createObjectStore("elements", { keyPath: "id" });
+                    elementStore.createIndex("by-project", "projectId");
+                }
+            },
+            blocking() {
+                // 其他标签页请求升级数据库时释放连接，下次访问时重新打开
+                void closeDB();
+            },
+            terminated() {
+                // 浏览器异常关闭连接，丢弃缓存以便下次重连
+                dbInstance = null;
+            },
+        }).finally(() => {
+            dbOpening = null;
+        });
+    }
 
+    dbInstance = await dbOpening;
     return dbInstance;
 }
 
@@ -193,6 +208,12 @@ export async function deleteNode(id: string): Promise<void> {
     await db.delete("nodes", id);
 }
 
+export async function deleteNodes(ids: string[]): Promise<void> {
+    const db = await getDB();
+    const tx = db.transaction("nodes", "readwrite");
+    await Promise.all([...ids.map(id => tx.store.delete(id)), tx.done]);
+}
+
 // ============= 连线操作 =============
 
 export async function saveEdge(edge: ShadowEdge & { moduleId: string }): Promise<void> {
@@ -215,6 +236,12 @@ export async function deleteEdge(id: string): Promise<void> {
     await db.delete("edges", id);
 }
 
+export async function deleteEdges(ids: string[]): Promise<void> {
+    const db = await getDB();
+    const tx = db.transaction("edges", "readwrite");
+    await Promise.all([...ids.map(id => tx.store.delete(id)), tx.done]);
+}
+
 // ============= 快照操作 =============
 
 export async function saveSnapshot(snapshot: VersionSnapshot): Promise<void> {
@@ -246,16 +273,14 @@ export async function saveElements(projectId: string, elements: any[]): Promise<
 
     // 删除旧元素
     const existingElements = await tx.store.index("by-project").getAllKeys(projectId);
-    for (const key of existingElements) {
-        await tx.store.delete(key);
-    }
-
-    // 保存新元素
-    for (const element of elements) {
-        await tx.store.put({ ...element, projectId });
-    }
 
-    await tx.done;
+    // 删除与保存请求一次性提交，同一 store 内按提交顺序执行
+    await Promise.all([
+        ...existingElements.map(key => tx.store.delete(key)),
+        // 保存新元素
+        ...elements.map(element => tx.store.put({ ...element, projectId })),
+        tx.done,
+    ]);
 }
 
 // eslint-disable-next-line @typescript-eslint/no-explicit-any
@@ -22,8 +22,8 @@ import {
     saveEdge,
     getEdgesByModule,
     deleteModule,
-    deleteNode,
-    deleteEdge,
+    deleteNodes,
+    deleteEdges,
 } from "./indexed-db";
 
 /**
@@ -175,10 +175,13 @@ export async function getModuleWithContents(
     nodes: ShadowNode[];
     edges: ShadowEdge[];
 }> {
-    const modules = await getModulesByProject(""); // 需要改进
+    // 三个查询互不依赖，并发发起
+    const [modules, nodes, edges] = await Promise.all([
+        getModulesByProject(""), // 需要改进
+        getNodesByModule(moduleId),
+        getEdgesByModule(moduleId),
+    ]);
     const module = modules.find((m) => m.id === moduleId);
-    const nodes = await getNodesByModule(moduleId);
-    const edges = await getEdgesByModule(moduleId);
 
     return { module, nodes, edges };
 }
@@ -187,17 +190,13 @@ export async function getModuleWithContents(
  * 删除模块及其所有内容
  */
 export async function deleteModuleWithContents(moduleId: string): Promise<void> {
-    // 删除所有节点
+    // 删除所有节点（单个事务批量删除）
     const nodes = await getNodesByModule(moduleId);
-    for (const node of nodes) {
-        await deleteNode(node.id);
-    }
+    await deleteNodes(nodes.map((node) => node.id));
 
     // 删除所有连线
     const edges = await getEdgesByModule(moduleId);
-    for (const edge of edges) {
-        await deleteEdge(edge.id);
-    }
+    await deleteEdges(edges.map((edge) => edge.id));
 
     // 删除模块
     await deleteModule(moduleId);
@@ -60,6 +60,16 @@ export function getApiKeysConfig(): ApiKeysStore {
     return { ...stored, keys: migratedKeys };
 }
 
+/**
+ * 在已解析的配置中查找指定 Provider 的 Key 配置
+ */
+function findKeyConfig(
+    config: ApiKeysStore,
+    provider: LLMProvider
+): ApiKeyConfig | undefined {
+    return config.keys.find((k) => k.provider === provider);
+}
+
 /**
  * 获取 Provider 的默认模型
  */
@@ -109,8 +119,7 @@ export function saveApiKey(
  * 获取指定 Provider 的 API Key
  */
 export function getApiKey(provider: LLMProvider): string | null {
-    const config = getApiKeysConfig();
-    const keyConfig = config.keys.find((k) => k.provider === provider);
+    const keyConfig = findKeyConfig(getApiKeysConfig(), provider);
     if (keyConfig === undefined) {
         return null;
     }
@@ -121,8 +130,7 @@ export function getApiKey(provider: LLMProvider): string | null {
  * 获取指定 Provider 的 Base URL
  */
 export function getBaseUrl(provider: LLMProvider): string {
-    const config = getApiKeysConfig();
-    const keyConfig = config.keys.find((k) => k.provider === provider);
+    const keyConfig = findKeyConfig(getApiKeysConfig(), provider);
     if (keyConfig === undefined) {
         return DEFAULT_BASE_URLS[provider];
     }
@@ -133,8 +141,7 @@ export function getBaseUrl(provider: LLMProvider): string {
  * 获取指定 Provider 的模型名称
  */
 export function getModel(provider: LLMProvider): string {
-    const config = getApiKeysConfig();
-    const keyConfig = config.keys.find((k) => k.provider === provider);
+    const keyConfig = findKeyConfig(getApiKeysConfig(), provider);
     if (keyConfig === undefined) {
         return DEFAULT_MODELS[provider];
     }
@@ -145,10 +152,10 @@ export function getModel(provider: LLMProvider): string {
  * 获取指定 Provider 的完整配置
  */
 export function getProviderConfig(
-    provider: LLMProvider
+    provider: LLMProvider,
+    config: ApiKeysStore = getApiKeysConfig()
 ): { key: string; baseUrl: string; model: string } | null {
-    const config = getApiKeysConfig();
-    const keyConfig = config.keys.find((k) => k.provider === provider);
+    const keyConfig = findKeyConfig(config, provider);
     if (keyConfig === undefined) {
         return null;
     }
@@ -169,7 +176,8 @@ export function getActiveApiKey(): {
         return null;
     }
 
-    const providerConfig = getProviderConfig(config.activeProvider);
+    // 复用已解析的配置，避免再次读取并解析 localStorage
+    const providerConfig = getProviderConfig(config.activeProvider, config);
     if (providerConfig === null) {
         return null;
     }
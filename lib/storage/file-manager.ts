@@ -40,6 +40,8 @@ interface FileDB extends DBSchema {
 }
 
 let dbInstance: IDBPDatabase<FileDB> | null = null;
+// 正在打开中的连接，避免并发调用重复 openDB
+let dbOpening: Promise<IDBPDatabase<FileDB>> | null = null;
 
 /**
  * 获取数据库实例
@@ -49,24 +51,37 @@ async function getDB(): Promise<IDBPDatabase<FileDB>> {
         return dbInstance;
     }
 
-    dbInstance = await openDB<FileDB>(DB_NAME, DB_VERSION, {
-        upgrade(db) {
-            // 文件表
-            if (!db.objectStoreNames.contains("files")) {
-                const fileStore = db.createObjectStore("files", { keyPath: "id" });
-                fileStore.createIndex("by-updated", "updatedAt");
-                fileStore.createIndex("by-name", "name");
-            }
+    if (dbOpening === null) {
+        dbOpening = openDB<FileDB>(DB_NAME, DB_VERSION, {
+            upgrade(db) {
+                // 文件表
+                if (!db.objectStoreNames.contains("files")) {
+                    const fileStore = db.createObjectStore("files", { keyPath: "id" });
+                    fileStore.createIndex("by-updated", "updatedAt");
+                    fileStore.createIndex("by-name", "name");
+                }
 
-            // 版本表（分离存储）
-            if (!db.objectStoreNames.contains("versions")) {
-                const versionStore = db.createObjectStore("versions", { keyPath: "id" });
-                versionStore.createIndex("by-file", "fileId");
-                versionStore.createIndex("by-created", "createdAt");
-            }
-        },
-    });
+                // 版本表（分离存储）
+                if (!db.objectStoreNames.contains("versions")) {
+                    const versionStore = db.createObjectStore("versions", { keyPath: "id" });
+                    versionStore.createIndex("by-file", "fileId");
+                    versionStore.createIndex("by-created", "createdAt");
+                }
+            },
+            blocking() {
+                // 其他标签页请求升级数据库时释放连接，下次访问时重新打开
+                void closeFileDB();
+            },
+            terminated() {
+                // 浏览器异常关闭连接，丢弃缓存以便下次重连
+                dbInstance = null;
+            },
+        }).finally(() => {
+            dbOpening = null;
+        });
+    }
 
+    dbInstance = await dbOpening;
     return dbInstance;
 }
 
@@ -113,19 +128,26 @@ export async function createFile(params: CreateFileParams): Promise<DiagramFile>
 export async function getFile(id: string): Promise<DiagramFile | undefined> {
     const db = await getDB();
 
-    const fileMetadata = await db.get("files", id);
+    // 元数据和版本数据在同一个只读事务中一起读取
+    const tx = db.transaction(["files", "versions"], "readonly");
+    const [fileMetadata, versions] = await Promise.all([
+        tx.objectStore("files").get(id),
+        tx.objectStore("versions").index("by-file").getAll(id),
+    ]);
     if (!fileMetadata) return undefined;
 
-    // 加载版本数据
-    const versions = await db.getAllFromIndex("versions", "by-file", id);
-
-    const simpleVersions = versions
-        .filter(v => v.type === "simple")
-        .sort((a, b) => b.versionNumber - a.versionNumber);
-
-    const professionalVersions = versions
-        .filter(v => v.type === "professional")
-        .sort((a, b) => b.versionNumber - a.versionNumber);
+    // 按类型一次遍历分组
+    const simpleVersions: DiagramVersion[] = [];
+    const professionalVersions: DiagramVersion[] = [];
+    for (const version of versions) {
+        if (version.type === "simple") {
+            simpleVersions.push(version);
+        } else {
+            professionalVersions.push(version);
+        }
+    }
+    simpleVersions.sort((a, b) => b.versionNumber - a.versionNumber);
+    professionalVersions.sort((a, b) => b.versionNumber - a.versionNumber);
 
     return {
         ...fileMetadata,
@@ -134,14 +156,28 @@ export async function getFile(id: string): Promise<DiagramFile | undefined> {
     };
 }
 
+/**
+ * 文件元数据（不含版本列表）
+ */
+export type DiagramFileMetadata = Omit<DiagramFile, "simpleVersions" | "professionalVersions">;
+
+/**
+ * 获取文件元数据（不加载版本内容）
+ * 元数据记录中的版本列表是过期的占位数据，需要版本数据时请使用 getFile
+ */
+export async function getFileMetadata(id: string): Promise<DiagramFileMetadata | undefined> {
+    const db = await getDB();
+    return db.get("files", id);
+}
+
 /**
  * 获取文件列表（仅元数据，不含版本内容）
  */
 export async function listFiles(): Promise<DiagramFile[]> {
     const db = await getDB();
     const files = await db.getAllFromIndex("files", "by-updated");
-    // 按更新时间倒序排列
-    return files.sort((a, b) => b.updatedAt - a.updatedAt);
+    // 索引已按更新时间升序返回，直接反转即为倒序，无需再排序
+    return files.reverse();
 }
 
 /**
@@ -173,16 +209,16 @@ export async function deleteFile(id: string): Promise<void> {
     const db = await getDB();
     const tx = db.transaction(["files", "versions"], "readwrite");
 
-    // 删除所有版本
-    const versions = await tx.objectStore("versions").index("by-file").getAllKeys(id);
-    for (const versionId of versions) {
-        await tx.objectStore("versions").delete(versionId);
-    }
+    // 删除所有版本（同一事务内批量提交，不逐条等待）
+    const versionStore = tx.objectStore("versions");
+    const versions = await versionStore.index("by-file").getAllKeys(id);
 
-    // 删除文件
-    await tx.objectStore("files").delete(id);
-
-    await tx.done;
+    await Promise.all([
+        ...versions.map(versionId => versionStore.delete(versionId)),
+        // 删除文件
+        tx.objectStore("files").delete(id),
+        tx.done,
+    ]);
 }
 
 /**
@@ -200,12 +236,14 @@ export async function saveFile(file: DiagramFile): Promise<void> {
     const metadata = createFileMetadata(updatedFile);
     await db.put("files", metadata);
 
-    // 保存所有版本
+    // 保存所有版本（批量提交，单次事务往返）
     const tx = db.transaction("versions", "readwrite");
-    for (const version of [...file.simpleVersions, ...file.professionalVersions]) {
-        await tx.store.put({ ...version, fileId: file.id });
-    }
-    await tx.done;
+    await Promise.all([
+        ...[...file.simpleVersions, ...file.professionalVersions].map(version =>
+            tx.store.put({ ...version, fileId: file.id })
+        ),
+        tx.done,
+    ]);
 }
 
 // ============= 版本操作 =============
@@ -219,40 +257,26 @@ export async function addVersion(
 ): Promise<DiagramFile | undefined> {
     const db = await getDB();
 
-    const file = await db.get("files", fileId);
-    if (!file) return undefined;
-
-    // 检查版本数量限制
-    const versions = await db.getAllFromIndex("versions", "by-file", fileId);
-    const typeVersions = versions.filter(v => v.type === version.type);
+    const added = await putVersion(db, fileId, version);
+    if (!added) return undefined;
 
-    const maxVersions = version.type === "simple"
-        ? FILE_CONFIG.MAX_SIMPLE_VERSIONS
-        : FILE_CONFIG.MAX_PROFESSIONAL_VERSIONS;
-
-    if (typeVersions.length >= maxVersions) {
-        // 删除最早的版本
-        const oldestVersion = typeVersions.sort((a, b) => a.createdAt - b.createdAt)[0];
-        await db.delete("versions", oldestVersion.id);
-    }
-
-    // 添加新版本
-    await db.put("versions", { ...version, fileId });
+    return getFile(fileId);
+}
 
-    // 更新文件的当前版本 ID
-    const updatedFile: DiagramFile = {
-        ...file,
-        updatedAt: Date.now(),
-    };
+/**
+ * 批量添加版本（全部写入后只加载一次完整文件）
+ */
+export async function addVersions(
+    fileId: string,
+    versions: DiagramVersion[]
+): Promise<DiagramFile | undefined> {
+    const db = await getDB();
 
-    if (version.type === "simple") {
-        updatedFile.currentSimpleVersionId = version.id;
-    } else {
-        updatedFile.currentProfessionalVersionId = version.id;
+    for (const version of versions) {
+        const added = await putVersion(db, fileId, version);
+        if (!added) return undefined;
     }
 
-    await db.put("files", updatedFile);
-
     return getFile(fileId);
 }
 
@@ -274,12 +298,13 @@ export async function getVersion(versionId: string): Promise<DiagramVersion | un
 export async function updateVersion(
     versionId: string,
     updates: Partial<DiagramVersion>
-): Promise<void> {
+): Promise<boolean> {
     const db = await getDB();
     const version = await db.get("versions", versionId);
-    if (!version) return;
+    if (!version) return false;
 
     await db.put("versions", { ...version, ...updates });
+    return true;
 }
 
 /**
@@ -386,6 +411,57 @@ export function removeFromRecentFiles(fileId: string): string[] {
 
 // ============= 辅助函数 =============
 
+/**
+ * 写入单个版本并更新文件的当前版本 ID
+ */
+async function putVersion(
+    db: IDBPDatabase<FileDB>,
+    fileId: string,
+    version: DiagramVersion
+): Promise<boolean> {
+    const file = await db.get("files", fileId);
+    if (!file) return false;
+
+    // 检查版本数量限制（游标逐条遍历，只保留同类型版本的 ID 和创建时间）
+    const typeVersions: Array<{ id: string; createdAt: number }> = [];
+    let cursor = await db.transaction("versions").store.index("by-file").openCursor(fileId);
+    while (cursor) {
+        if (cursor.value.type === version.type) {
+            typeVersions.push({ id: cursor.value.id, createdAt: cursor.value.createdAt });
+        }
+        cursor = await cursor.continue();
+    }
+
+    const maxVersions = version.type === "simple"
+        ? FILE_CONFIG.MAX_SIMPLE_VERSIONS
+        : FILE_CONFIG.MAX_PROFESSIONAL_VERSIONS;
+
+    if (typeVersions.length >= maxVersions) {
+        // 删除最早的版本
+        const oldestVersion = typeVersions.sort((a, b) => a.createdAt - b.createdAt)[0];
+        await db.delete("versions", oldestVersion.id);
+    }
+
+    // 添加新版本
+    await db.put("versions", { ...version, fileId });
+
+    // 更新文件的当前版本 ID
+    const updatedFile: DiagramFile = {
+        ...file,
+        updatedAt: Date.now(),
+    };
+
+    if (version.type === "simple") {
+        updatedFile.currentSimpleVersionId = version.id;
+    } else {
+        updatedFile.currentProfessionalVersionId = version.id;
+    }
+
+    await db.put("files", updatedFile);
+
+    return true;
+}
+
 /**
  * 创建文件元数据（不含版本内容）
  */
@@ -21,11 +21,13 @@ export {
     closeFileDB,
     createFile,
     getFile,
+    getFileMetadata,
     listFiles,
     updateFile,
     deleteFile,
     saveFile,
     addVersion,
+    addVersions,
     getVersion,
     updateVersion,
     deleteVersion,
@@ -35,6 +37,7 @@ export {
     removeFromRecentFiles,
     createAutoSaver,
 } from "./file-manager";
+export type { DiagramFileMetadata } from "./file-manager";
 
 // 版本管理
 export {
@@ -15,8 +15,10 @@ import {
 } from "@/types/diagram-file";
 import {
     getFile,
+    getFileMetadata,
     saveFile,
     addVersion,
+    addVersions,
     deleteVersion as deleteVersionFromDB,
     switchVersion as switchVersionInDB,
     updateVersion,
@@ -54,16 +56,15 @@ export async function autoSaveSimpleVersion(
     // eslint-disable-next-line @typescript-eslint/no-explicit-any
     elements: any[]
 ): Promise<void> {
-    const file = await getFile(fileId);
+    // 只需当前版本 ID，读取元数据即可，避免加载所有版本的元素
+    const file = await getFileMetadata(fileId);
     if (!file) return;
 
-    const currentVersion = getCurrentSimpleVersion(file);
-    if (!currentVersion) return;
-
-    // 更新当前版本的元素
-    await updateVersion(currentVersion.id, {
+    // 更新当前版本的元素，版本不存在时不更新时间戳
+    const updated = await updateVersion(file.currentSimpleVersionId, {
         excalidrawElements: elements,
     });
+    if (!updated) return;
 
     // 同时更新文件的 updatedAt 时间戳
     const { updateFile } = await import("./file-manager");
@@ -352,12 +353,5 @@ export async function importVersions(
     fileId: string,
     versions: DiagramVersion[]
 ): Promise<DiagramFile | undefined> {
-    const file = await getFile(fileId);
-    if (!file) return undefined;
-
-    for (const version of versions) {
-        await addVersion(fileId, version);
-    }
-
-    return getFile(fileId);
+    return addVersions(fileId, versions);
 }
@@ -50,7 +50,11 @@ export async function generateThumbnail(
         // 使用 Canvas 缩放到目标尺寸
         return new Promise((resolve) => {
             const img = new Image();
+            const objectUrl = URL.createObjectURL(blob);
             img.onload = () => {
+                // 图片已解码，释放对导出 Blob 的引用
+                URL.revokeObjectURL(objectUrl);
+
                 // 计算缩放以适应目标尺寸
                 const scale = Math.min(maxWidth / img.width, maxHeight / img.height);
                 const targetWidth = Math.round(img.width * scale);
@@ -74,9 +78,10 @@ export async function generateThumbnail(
                 resolve(canvas.toDataURL("image/png"));
             };
             img.onerror = () => {
+                URL.revokeObjectURL(objectUrl);
                 resolve(undefined);
             };
-            img.src = URL.createObjectURL(blob);
+            img.src = objectUrl;
         });
     } catch (error) {
         console.error("[Thumbnail] Generation failed:", error);